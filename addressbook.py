@@ -1,6 +1,23 @@
 import re
-from collections import UserDict
-from datetime import datetime, timedelta
+import sys
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+
+# Shift that moves a weekend date to Monday, indexed by isoweekday (index 0 unused).
+_WEEKEND_SHIFT = tuple(timedelta(days=d) for d in (0, 0, 0, 0, 0, 0, 2, 1))
+
+# Cumulative day counts of a non-leap year, indexed by month (index 0 unused).
+# Feb 29 maps onto the same day of year as Mar 1.
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _day_of_year(month: int, day: int) -> int:
+    return _DAYS_BEFORE_MONTH[month] + day
+
+
+def _norm(name: str) -> str:
+    return sys.intern(name.strip().capitalize())
 
 
 class PhoneFormatError(Exception):
@@ -12,6 +29,8 @@ class DateFormatError(Exception):
 
 
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -20,78 +39,117 @@ class Field:
 
 
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, name: str):
-        super().__init__(name.strip().capitalize())
+        self.value = _norm(name)
+
+    @classmethod
+    def _make(cls, value: str) -> "Name":
+        # Build a name from an already normalized value, skipping __init__.
+        name = object.__new__(cls)
+        name.value = value
+        return name
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, phone: str):
-        if self.__validate_phone(phone):
-            super().__init__(phone)
+        if Phone.__validate_phone(phone):
+            self.value = phone
         else:
             raise PhoneFormatError(f"wrong phone format {phone}")
 
-    def __validate_phone(self, value: str) -> bool:
-        pattern = re.compile(r"^\d{10}$")
-        return bool(pattern.match(value))
+    @staticmethod
+    def __validate_phone(value: str) -> bool:
+        return len(value) == 10 and value.isdecimal()
 
 
 class Birthday(Field):
+    __slots__ = ("month_day", "doy")
+
+    _DATE_RE = re.compile(r"^(0[1-9]|[12][0-9]|3[01])\.(0[1-9]|1[0-2])\.\d{4}$")
+
     def __init__(self, value):
-        if self.__validate_date(value):
-            b_date = datetime.strptime(value.strip(), "%d.%m.%Y").date()
-            super().__init__(b_date)
+        if Birthday.__validate_date(value):
+            s = value.strip()
+            b_date = date(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+            self.value = b_date
+            self.month_day = (b_date.month, b_date.day)
+            self.doy = _day_of_year(*self.month_day)
         else:
             raise DateFormatError("Invalid date format. Use DD.MM.YYYY")
 
-    def __validate_date(self, value):
-        pattern = re.compile(r"^(0[1-9]|[12][0-9]|3[01])\.(0[1-9]|1[0-2])\.\d{4}$")
-        return bool(pattern.match(value.strip()))
+    @staticmethod
+    def __validate_date(value):
+        value = value.strip()
+        return (
+            len(value) == 10
+            and value[2] == "."
+            and value[5] == "."
+            and Birthday._DATE_RE.match(value) is not None
+        )
 
     def __str__(self):
         return f"Birthday: {self.value.strftime("%d.%m.%Y")}"
 
 
 class Record:
+    __slots__ = ("name", "_phones", "birthday")
+
     def __init__(self, name: str):
         self.name = Name(name)
-        self.phones = []
+        self._phones: dict[str, Phone] = {}
         self.birthday = None
 
+    @classmethod
+    def _make(
+        cls,
+        name: Name,
+        phones: dict[str, Phone],
+        birthday: Birthday | None = None,
+    ) -> "Record":
+        # Build a record from already validated fields, skipping __init__.
+        record = object.__new__(cls)
+        record.name = name
+        record._phones = phones
+        record.birthday = birthday
+        return record
+
     def add_phone(self, new_phone: str) -> bool:
-        if self.__get_phone_index(new_phone) is None:
-            self.phones.append(Phone(new_phone))
-            return True
-        return False
+        if new_phone in self._phones:
+            return False
+        self._phones[new_phone] = Phone(new_phone)
+        return True
 
     def remove_phone(self, phone_number: str) -> bool:
-        index = self.__get_phone_index(phone_number)
-        if index is not None:
-            self.phones.pop(index)
-            return True
-        return False
+        return self._phones.pop(phone_number, None) is not None
 
     def edit_phone(self, old_number: str, new_number: str) -> bool:
-        index = self.__get_phone_index(old_number)
-        if index is not None:
-            self.phones[index] = Phone(new_number)
-            return True
-        return False
+        if old_number not in self._phones:
+            return False
+        if new_number != old_number and new_number in self._phones:
+            return False
+        phone = Phone(new_number)
+        # Rebuild the dict so the edited number keeps its position.
+        phones = {}
+        for number, existing in self._phones.items():
+            if number == old_number:
+                phones[new_number] = phone
+            else:
+                phones[number] = existing
+        self._phones = phones
+        return True
 
     def find_phone(self, phone_number: str) -> str:
-        return phone_number if self.__get_phone_index(phone_number) else ""
+        return phone_number if phone_number in self._phones else ""
 
     def add_birthday(self, b_date: str) -> None:
         self.birthday = Birthday(b_date)
 
-    def __get_phone_index(self, phone_number: str) -> int | None:
-        for index, phone in enumerate(self.phones):
-            if phone.value == phone_number:
-                return index
-        return None
-
     def __str__(self):
-        phones = "; ".join(p.value for p in self.phones)
+        phones = "; ".join(p.value for p in self._phones.values())
         birthday = (
             self.birthday.value.strftime("%d.%m.%Y")
             if self.birthday is not None
@@ -104,30 +162,59 @@ class Record:
         )
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
 
     def add_record(self, record: Record) -> None:
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    def bulk_load(self, rows: Iterable[tuple[str, str, str | None]]) -> None:
+        # Rows are (name, phone, birthday or None); rows for a name already
+        # in the book extend that record. All rows are validated before any
+        # contact is touched, so a bad row leaves the book unchanged.
+        parsed = [
+            (
+                _norm(name),
+                Phone(phone),
+                Birthday(b_date) if b_date is not None else None,
+            )
+            for name, phone, b_date in rows
+        ]
+        loaded = {}
+        for key, phone, birthday in parsed:
+            record = loaded.get(key) or self.get(key)
+            if record is None:
+                record = Record._make(Name._make(key), {})
+            loaded[key] = record
+            record._phones.setdefault(phone.value, phone)
+            if birthday is not None:
+                record.birthday = birthday
+        self.update(loaded)
 
     def find(self, name: str) -> Record | None:
-        return self.data.get(name.strip().capitalize())
+        return self.get(_norm(name))
 
     def delete(self, name: str) -> bool:
         try:
-            del self.data[name.strip().capitalize()]
+            del self[_norm(name)]
             return True
         except KeyError:
             return False
 
     def get_upcoming_birthday(self) -> list:
-        today_date = datetime.today().date()
+        today_date = date.today()
         congrat_list = []
         congrats_date = None
+        today_doy = _day_of_year(today_date.month, today_date.day)
 
-        for record in self.data.values():
-            if not record.birthday:
-                continue
+        # Cheap pre-filter on day of year; one day of slack covers Feb 29.
+        candidates = [
+            record
+            for record in self.values()
+            if record.birthday is not None
+            and (record.birthday.doy - today_doy) % 365 <= 7
+        ]
 
+        for record in candidates:
             birthday_data_obj = record.birthday.value
             birthday_this_year = birthday_data_obj.replace(year=today_date.year)
 
@@ -139,8 +226,8 @@ class AddressBook(UserDict):
             days_until_birthday = (birthday_this_year - today_date).days
 
             if 0 <= days_until_birthday < 7:
-                congrats_date = birthday_this_year + timedelta(
-                    days=self.__check_weekend(birthday_this_year)
+                congrats_date = (
+                    birthday_this_year + _WEEKEND_SHIFT[birthday_this_year.isoweekday()]
                 )
 
                 congrat_list.append(
@@ -152,17 +239,5 @@ class AddressBook(UserDict):
 
         return congrat_list
 
-    def __check_weekend(self, date: datetime.date) -> int:
-        match date.isoweekday():
-            case 6:
-                return 2
-            case 7:
-                return 1
-            case _:
-                return 0
-
     def __str__(self):
-        result = ""
-        for record in self.data.values():
-            result += str(record) + "\n"
-        return result
+        return "".join(f"{record}\n" for record in self.values())
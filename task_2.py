@@ -1,29 +1,28 @@
+import sys
 from functools import wraps
 
 from addressbook import AddressBook, DateFormatError, PhoneFormatError, Record
 
 
+_USAGE = {
+    "parse_input": "Command can not be blank",
+    "add_contact": "Usage: add NAME PHONE_NUMBER",
+    "change_contact": "Usage: change NAME OLD_NUMBER NEW_NUMBER",
+    "show_phone": "Usage: phone NAME",
+    "add_birthday": "Usage: add-birthday NAME DATE(DD.MM.YYYY)",
+    "show_birthday": "Usage: show-birthday NAME",
+}
+
+
 def input_error(func):
+    usage = _USAGE.get(func.__name__, f"error in {func.__name__}")
+
     @wraps(func)
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except (ValueError, TypeError, IndexError):
-            match func.__name__:
-                case "parse_input":
-                    print("Command can not be blank")
-                case "add_contact":
-                    print("Usage: add NAME PHONE_NUMBER")
-                case "change_contact":
-                    print("Usage: change NAME OLD_NUMBER NEW_NUMBER")
-                case "show_phone":
-                    print("Usage: phone NAME")
-                case "add_birthday":
-                    print("Usage: add-birthday NAME DATE(DD.MM.YYYY)")
-                case "show_birthday":
-                    print("Usage: show-birthday NAME")
-                case _:
-                    print(f"error in {func.__name__}")
+            print(usage)
         except PhoneFormatError:
             print("Wrong phone format.")
         except DateFormatError:
@@ -34,9 +33,8 @@ def input_error(func):
 
 @input_error
 def parse_input(user_input):
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    cmd, *rest = user_input.split(maxsplit=1)
+    return cmd.lower(), *(rest[0].split() if rest else ())
 
 
 @input_error
@@ -59,20 +57,22 @@ def add_contact(args, book: AddressBook):
 @input_error
 def change_contact(args, book: AddressBook):
     name, old_phone, new_phone = args
-    record = book.find(name.strip().capitalize())
+    record = book.find(name)
     if record is None:
         return "Contact does not exist."
+    if not record.find_phone(old_phone):
+        return "Old phone number not found"
     return (
         "Contact updated."
         if record.edit_phone(old_phone, new_phone)
-        else "Old phone number not found"
+        else "Phone number already exists."
     )
 
 
 @input_error
 def show_phone(args, book: AddressBook):
     name = args[0]
-    record = book.find(name.strip().capitalize())
+    record = book.find(name)
     return str(record) if record else "Contact not found"
 
 
@@ -108,53 +108,60 @@ def show_birthday(args, book: AddressBook):
 def show_birthdays_next_week(book: AddressBook):
     birthdays = book.get_upcoming_birthday()
     if birthdays:
-        text = ""
-        for person in birthdays:
-            text += (
-                f"Name: {person['name']}, "
-                f"Congratulation date: {person['congratulation_date']}\n"
-            )
-        return text.strip()
+        return "\n".join(
+            f"Name: {person['name']}, "
+            f"Congratulation date: {person['congratulation_date']}"
+            for person in birthdays
+        )
     return "Birthdays not found"
 
 
+def read_commands():
+    # Prompt only on a terminal; piped input is read line by line.
+    if sys.stdin.isatty():
+        while True:
+            yield input("Enter a command: ")
+    else:
+        yield from sys.stdin
+
+
 def main():
     book = AddressBook()
-    print("Welcome to the assistant bot!")
-    while True:
-        user_input = input("Enter a command: ")
+    write = sys.stdout.write
+    write("Welcome to the assistant bot!\n")
+    for user_input in read_commands():
         if not (parsed_user_input := parse_input(user_input)):
             continue
         command, *args = parsed_user_input
 
         match command:
             case "close" | "exit":
-                print("Good bye!")
+                write("Good bye!\n")
                 break
             case "hello":
-                print("How can I help you?")
+                write("How can I help you?\n")
             case "add":
                 if message := add_contact(args, book):
-                    print(message)
+                    write(f"{message}\n")
             case "all":
-                print(show_all(book))
+                write(f"{show_all(book)}\n")
             case "add-birthday":
                 if message := add_birthday(args, book):
-                    print(message)
+                    write(f"{message}\n")
             case "show-birthday":
                 if message := show_birthday(args, book):
-                    print(message)
+                    write(f"{message}\n")
             case "birthdays":
                 if message := show_birthdays_next_week(book):
-                    print(message)
+                    write(f"{message}\n")
             case "change":
                 if message := change_contact(args, book):
-                    print(message)
+                    write(f"{message}\n")
             case "phone":
                 if message := show_phone(args, book):
-                    print(message)
+                    write(f"{message}\n")
             case _:
-                print("Invalid command.")
+                write("Invalid command.\n")
 
 
 if __name__ == "__main__":